@@ -1,6 +1,11 @@
+import re
 import sys
+from functools import lru_cache
 from typing import Callable, Optional
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from services.logger import get_logger
 
 log = get_logger("hotkey")
@@ -8,11 +13,49 @@ log = get_logger("hotkey")
 # Platform detection
 IS_LINUX = sys.platform.startswith('linux')
 
+# How long start()/stop() wait for keyboard hook changes on the worker thread
+_KEYBOARD_TASK_TIMEOUT = 2.0
+
 # Canonical modifier order for consistent hotkey strings
 MODIFIER_ORDER = ['ctrl', 'alt', 'shift', 'win']
 VALID_MODIFIERS = {'ctrl', 'alt', 'shift', 'win', 'windows', 'left windows', 'right windows'}
+_MOD_SET = frozenset(MODIFIER_ORDER)
+# One bit per modifier; main keys of a hotkey get the bits above these
+_MASK_BIT = {name: 1 << i for i, name in enumerate(MODIFIER_ORDER)}
+_WIN_ALIASES = frozenset({'windows', 'left windows', 'right windows'})
+# Names the keyboard library may know the win key by, for scan code lookup
+_WIN_SCAN_NAMES = ('win', 'windows', 'left windows', 'right windows')
+# Alternate key names mapped to their canonical form
+_NAME_MAP = {**dict.fromkeys(_WIN_ALIASES, 'win'), 'control': 'ctrl'}
+# Two or more non-empty keys joined by '+'; anything else can be rejected
+# before splitting
+_HOTKEY_RE = re.compile(r'\s*[^+\s][^+]*(?:\+\s*[^+\s][^+]*)+')
+
+
+def _split_hotkey(hotkey: str) -> tuple[list[str], list[str]]:
+    """Split a hotkey string into (modifiers, main_keys) with canonical key names.
+
+    Normalizes, classifies and dedupes every part in a single pass. Both lists
+    keep the order in which keys first appear.
+    """
+    modifiers = []
+    main_keys = []
+    mod_seen = set()
+    main_seen = set()
+    for raw in hotkey.split('+'):
+        raw = raw.strip().lower()
+        p = _NAME_MAP.get(raw, raw)
+        if p in _MOD_SET:
+            if p not in mod_seen:  # Avoid duplicates
+                mod_seen.add(p)
+                modifiers.append(p)
+        elif p not in main_seen:  # Avoid duplicates
+            main_seen.add(p)
+            main_keys.append(p)
+    return modifiers, main_keys
 
 
+@lru_cache(maxsize=256)
 def normalize_hotkey(hotkey: str) -> str:
     """Normalize a hotkey string to a canonical format.
 
@@ -24,36 +67,31 @@ def normalize_hotkey(hotkey: str) -> str:
     if not hotkey or not hotkey.strip():
         return hotkey
 
-    parts = [p.strip().lower() for p in hotkey.split('+')]
+    modifiers, main_keys = _split_hotkey(hotkey)
 
-    # Normalize key names
-    normalized_parts = []
-    for p in parts:
-        if p in ('windows', 'left windows', 'right windows'):
-            normalized_parts.append('win')
-        elif p == 'control':
-            normalized_parts.append('ctrl')
-        else:
-            normalized_parts.append(p)
+    # Put modifiers in canonical order
+    modifiers = [m for m in MODIFIER_ORDER if m in modifiers]
 
-    # Separate modifiers and main keys
-    modifiers = []
-    main_keys = []
-    for p in normalized_parts:
-        if p in {'ctrl', 'alt', 'shift', 'win'}:
-            if p not in modifiers:  # Avoid duplicates
-                modifiers.append(p)
-        else:
-            if p not in main_keys:  # Avoid duplicates
-                main_keys.append(p)
+    # Sort main keys alphabetically for consistency
+    if len(main_keys) > 1:
+        main_keys.sort()
 
-    # Sort modifiers by canonical order
-    modifiers.sort(key=lambda m: MODIFIER_ORDER.index(m) if m in MODIFIER_ORDER else 99)
+    # Interned so equality checks against stored hotkeys are pointer compares
+    return sys.intern('+'.join((*modifiers, *main_keys)))
 
-    # Sort main keys alphabetically for consistency
-    main_keys.sort()
 
-    return '+'.join(modifiers + main_keys)
+@lru_cache(maxsize=256)
+def _hotkey_signature(hotkey: str) -> tuple[int, frozenset[str]]:
+    """Return an order-independent (modifier_bitmask, main_keys) signature.
+
+    Two non-blank hotkeys have the same signature exactly when they normalize
+    to the same string, so signatures can be compared without any string work.
+    """
+    modifiers, main_keys = _split_hotkey(hotkey)
+    mask = 0
+    for m in modifiers:
+        mask |= _MASK_BIT[m]
+    return mask, frozenset(main_keys)
 
 
 # Validation utilities
@@ -69,30 +107,25 @@ def validate_hotkey(hotkey: str) -> tuple[bool, str]:
     if not hotkey or not hotkey.strip():
         return False, "Hotkey cannot be empty"
 
-    parts = [p.strip().lower() for p in hotkey.split('+')]
-
-    if len(parts) < 2:
+    if not _HOTKEY_RE.fullmatch(hotkey):
+        if '+' in hotkey:
+            return False, "Hotkey contains an empty key"
         return False, "Hotkey must have at least two keys"
 
+    parts = [p.strip().lower() for p in hotkey.split('+')]
+
     # Normalize key names for validation
-    normalized_parts = []
-    for p in parts:
-        if p in ('windows', 'left windows', 'right windows'):
-            normalized_parts.append('win')
-        elif p == 'control':
-            normalized_parts.append('ctrl')
-        else:
-            normalized_parts.append(p)
+    normalized_parts = [_NAME_MAP.get(p, p) for p in parts]
 
     # Check that we have at least one modifier
-    modifiers = [p for p in normalized_parts if p in {'ctrl', 'alt', 'shift', 'win'}]
+    modifiers = [p for p in normalized_parts if p in _MOD_SET]
     if not modifiers:
         return False, "Hotkey must include at least one modifier (Ctrl, Alt, Shift, or Win)"
 
     # Allow either:
     # 1. At least one modifier + at least one non-modifier key (e.g., "ctrl+r")
     # 2. At least two modifiers (e.g., "ctrl+win") - these are valid hotkeys
-    main_keys = [p for p in normalized_parts if p not in {'ctrl', 'alt', 'shift', 'win'}]
+    main_keys = [p for p in normalized_parts if p not in _MOD_SET]
     if not main_keys and len(modifiers) < 2:
         return False, "Hotkey must have at least two keys (modifier+key or multiple modifiers)"
 
@@ -101,10 +134,51 @@ def validate_hotkey(hotkey: str) -> tuple[bool, str]:
 
 def are_hotkeys_conflicting(hotkey1: str, hotkey2: str) -> bool:
     """Check if two hotkeys conflict (are identical when normalized)."""
-    if not hotkey1 or not hotkey2:
+    if not hotkey1 or not hotkey2 or not hotkey1.strip() or not hotkey2.strip():
         return False
 
-    return normalize_hotkey(hotkey1) == normalize_hotkey(hotkey2)
+    return _hotkey_signature(hotkey1) == _hotkey_signature(hotkey2)
+
+
+def find_conflicting_hotkeys(hotkeys: list[str]) -> list[tuple[int, int]]:
+    """Find all pairs of conflicting hotkeys in a list.
+
+    Returns (i, j) index pairs with i < j, in input order. Empty or blank
+    hotkeys never conflict. Hotkeys are grouped by signature in linear time
+    instead of comparing every pair; beyond that, the work is proportional to
+    the number of conflicting pairs returned.
+    """
+    groups: dict[tuple[int, frozenset[str]], list[int]] = {}
+    conflicts = []
+    for j, hotkey in enumerate(hotkeys):
+        if not hotkey or not hotkey.strip():
+            continue
+        seen = groups.setdefault(_hotkey_signature(hotkey), [])
+        conflicts.extend((i, j) for i in seen)
+        seen.append(j)
+    return conflicts
+
+
+def _hotkey_key_bits(hotkey: str) -> tuple[dict[str, int], int]:
+    """Assign a bit to every key of a hotkey so release checks are a masked compare.
+
+    Returns (bit per canonical key name, mask with all of the hotkey's bits set).
+    """
+    modifier_mask, main_keys = _hotkey_signature(hotkey)
+    bits = {m: bit for m, bit in _MASK_BIT.items() if modifier_mask & bit}
+    for slot, key in enumerate(sorted(main_keys), len(MODIFIER_ORDER)):
+        bits[key] = 1 << slot
+    required = 0
+    for bit in bits.values():
+        required |= bit
+    return bits, required
+
+
+@lru_cache(maxsize=64)
+def _parse_hotkey_keys_cached(hotkey: str) -> tuple[str, ...]:
+    """Parse hotkey string into individual key names, normalizing alternate names."""
+    parts = [k.strip().lower() for k in hotkey.split('+')]
+    return tuple(_NAME_MAP.get(p, p) for p in parts)
 
 
 # ============================================================================
@@ -175,6 +249,25 @@ if IS_LINUX:
 
 
 class HotkeyService:
+    __slots__ = (
+        '_on_activate', '_on_deactivate',
+        '_hold_active', '_toggle_active', '_running',
+        '_max_deadline', '_max_lock', '_max_timer_thread', '_max_timer_stop',
+        '_hold_hotkey', '_hold_hotkey_enabled', '_toggle_hotkey', '_toggle_hotkey_enabled',
+        '_hold_keys_parsed', '_hold_key_bits', '_hold_required_mask', '_toggle_keys_parsed',
+        '_hold_scan_bits', '_pressed_scan_codes', '_pressed_bit_counts', '_pressed_mask', '_hook', '_keyboard_executor',
+        # Linux evdev state
+        '_evdev_thread', '_evdev_stop', '_pressed_keys',
+    )
+
+    # Default hotkeys, parsed once for all instances. configure() recomputes
+    # the derived values on the instance only when a hotkey changes.
+    _DEFAULT_HOLD = sys.intern("ctrl+win")
+    _DEFAULT_HOLD_PARSED = _parse_hotkey_keys_cached(_DEFAULT_HOLD)
+    _DEFAULT_HOLD_KEY_BITS, _DEFAULT_HOLD_MASK = _hotkey_key_bits(_DEFAULT_HOLD)
+    _DEFAULT_TOGGLE = sys.intern("ctrl+shift+win")
+    _DEFAULT_TOGGLE_PARSED = _parse_hotkey_keys_cached(_DEFAULT_TOGGLE)
+
     def __init__(self):
         # Callbacks
         self._on_activate: Optional[Callable[[], None]] = None
@@ -184,14 +277,37 @@ class HotkeyService:
         self._hold_active = False
         self._toggle_active = False
         self._running = False
-        self._max_recording_timer: Optional[threading.Timer] = None
+        self._max_deadline: Optional[float] = None  # time.monotonic() deadline
+        self._max_lock = threading.Lock()
+        self._max_timer_thread: Optional[threading.Thread] = None
+        self._max_timer_stop = threading.Event()
 
         # Hotkey configuration (defaults)
-        self._hold_hotkey: str = "ctrl+win"
+        self._hold_hotkey: str = self._DEFAULT_HOLD
         self._hold_hotkey_enabled: bool = True
-        self._toggle_hotkey: str = "ctrl+shift+win"
+        self._toggle_hotkey: str = self._DEFAULT_TOGGLE
         self._toggle_hotkey_enabled: bool = False
 
+        # Parsed key lists, precomputed so key event handlers don't re-parse
+        self._hold_keys_parsed: tuple[str, ...] = self._DEFAULT_HOLD_PARSED
+        self._hold_key_bits: dict[str, int] = self._DEFAULT_HOLD_KEY_BITS
+        self._hold_required_mask: int = self._DEFAULT_HOLD_MASK
+        self._toggle_keys_parsed: tuple[str, ...] = self._DEFAULT_TOGGLE_PARSED
+
+        # Windows key state as a bitmask over _hold_key_bits, tracked from
+        # our own press/release hooks. Events are matched by scan code, since
+        # event names vary with shift state and keyboard side ('!', 'right ctrl').
+        # Both sides of a modifier share a bit, so each bit counts its held
+        # scan codes and is only cleared when the last one is released.
+        self._hold_scan_bits: dict[int, int] = {}
+        self._pressed_scan_codes: set[int] = set()  # Filters out key repeats
+        self._pressed_bit_counts: dict[int, int] = {}
+        self._pressed_mask: int = 0
+        self._hook: Optional[Callable] = None  # keyboard.hook() handle
+        # keyboard hook changes run here, in order, off the calling thread.
+        # Created on first use and shut down in stop().
+        self._keyboard_executor: Optional[ThreadPoolExecutor] = None
+
         # Linux evdev state
         if IS_LINUX:
             self._evdev_thread: Optional[threading.Thread] = None
@@ -217,19 +333,22 @@ class HotkeyService:
         """Update hotkey configuration and re-register handlers if running."""
         needs_restart = False
 
-        # Normalize hotkeys before storing to ensure consistent format
-        if hold_hotkey is not None:
+        # Normalize hotkeys before storing to ensure consistent format.
+        # A value equal to the stored one is already normalized, so skip it.
+        if hold_hotkey is not None and hold_hotkey != self._hold_hotkey:
             hold_hotkey = normalize_hotkey(hold_hotkey)
             if hold_hotkey != self._hold_hotkey:
                 self._hold_hotkey = hold_hotkey
+                self._update_hold_keys()
                 needs_restart = True
         if hold_enabled is not None and hold_enabled != self._hold_hotkey_enabled:
             self._hold_hotkey_enabled = hold_enabled
             needs_restart = True
-        if toggle_hotkey is not None:
+        if toggle_hotkey is not None and toggle_hotkey != self._toggle_hotkey:
             toggle_hotkey = normalize_hotkey(toggle_hotkey)
             if toggle_hotkey != self._toggle_hotkey:
                 self._toggle_hotkey = toggle_hotkey
+                self._update_toggle_keys()
                 needs_restart = True
         if toggle_enabled is not None and toggle_enabled != self._toggle_hotkey_enabled:
             self._toggle_hotkey_enabled = toggle_enabled
@@ -237,20 +356,24 @@ class HotkeyService:
 
         if needs_restart and self._running:
             log.info("Hotkey configuration changed, re-registering hotkeys")
-            self._unregister_hotkeys()
-            self._register_hotkeys()
+            # Not waited on, so report failures from the worker thread
+            for future in (self._unregister_hotkeys(), self._register_hotkeys()):
+                if future is not None:
+                    future.add_done_callback(self._log_keyboard_task_error)
 
-    def _parse_hotkey_keys(self, hotkey: str) -> list[str]:
+    def _parse_hotkey_keys(self, hotkey: str) -> tuple[str, ...]:
         """Parse hotkey string into individual key names for release monitoring."""
-        parts = [k.strip().lower() for k in hotkey.split('+')]
-        # Normalize windows key variants
-        result = []
-        for p in parts:
-            if p in ('windows', 'left windows', 'right windows'):
-                result.append('win')
-            else:
-                result.append(p)
-        return result
+        return _parse_hotkey_keys_cached(hotkey)
+
+    def _update_hold_keys(self):
+        """Recompute the parsed hold hotkey keys and key bits after the hotkey changes."""
+        self._hold_keys_parsed = self._parse_hotkey_keys(self._hold_hotkey)
+
+        self._hold_key_bits, self._hold_required_mask = _hotkey_key_bits(self._hold_hotkey)
+
+    def _update_toggle_keys(self):
+        """Recompute the parsed toggle hotkey keys after the hotkey changes."""
+        self._toggle_keys_parsed = self._parse_hotkey_keys(self._toggle_hotkey)
 
     # Hold mode handlers
     def _on_hold_press(self):
@@ -301,17 +424,47 @@ class HotkeyService:
 
     # Timer management
     def _start_max_timer(self):
-        """Start a timer to auto-stop recording after 60 seconds."""
-        self._cancel_max_timer()
-        self._max_recording_timer = threading.Timer(60.0, self._on_max_timer)
-        self._max_recording_timer.daemon = True
-        self._max_recording_timer.start()
+        """Set a 60 second recording deadline, checked by a heartbeat thread."""
+        with self._max_lock:
+            self._max_deadline = time.monotonic() + 60.0
+        if self._max_timer_thread is None or not self._max_timer_thread.is_alive():
+            # Each heartbeat thread gets its own stop event, so a thread that
+            # was stopped can't miss it if a new one is started meanwhile.
+            self._max_timer_stop = threading.Event()
+            self._max_timer_thread = threading.Thread(
+                target=self._max_timer_loop,
+                args=(self._max_timer_stop,),
+                daemon=True,
+            )
+            self._max_timer_thread.start()
 
     def _cancel_max_timer(self):
-        """Cancel the max recording timer."""
-        if self._max_recording_timer:
-            self._max_recording_timer.cancel()
-            self._max_recording_timer = None
+        """Cancel the max recording deadline."""
+        with self._max_lock:
+            self._max_deadline = None
+
+    def _stop_max_timer_thread(self):
+        """Stop the heartbeat thread."""
+        self._max_timer_stop.set()
+        self._max_timer_thread = None
+
+    def _max_timer_loop(self, stop: threading.Event):
+        """Background thread: check the recording deadline once a second."""
+        while not stop.wait(1.0):
+            self._check_max_deadline()
+
+    def _check_max_deadline(self) -> bool:
+        """Stop recording if the deadline has passed; return True if it had.
+
+        The deadline is cleared under the lock, so concurrent checks fire once.
+        """
+        with self._max_lock:
+            deadline = self._max_deadline
+            if deadline is None or time.monotonic() < deadline:
+                return False
+            self._max_deadline = None
+        self._on_max_timer()
+        return True
 
     def _on_max_timer(self):
         """Called when max recording time is reached."""
@@ -325,19 +478,63 @@ class HotkeyService:
     # Platform-specific hotkey registration
     # ========================================================================
 
-    def _register_hotkeys(self):
-        """Register all enabled hotkeys."""
+    def _register_hotkeys(self) -> Optional[Future]:
+        """Register all enabled hotkeys.
+
+        Returns the pending keyboard task on Windows, None on Linux.
+        """
         if IS_LINUX:
             self._register_hotkeys_evdev()
-        else:
-            self._register_hotkeys_keyboard()
+            return None
+        return self._submit_keyboard_task(self._register_hotkeys_keyboard)
+
+    def _unregister_hotkeys(self) -> Optional[Future]:
+        """Unregister all hotkeys and release handlers.
 
-    def _unregister_hotkeys(self):
-        """Unregister all hotkeys and release handlers."""
+        Returns the pending keyboard task on Windows, None on Linux.
+        """
         if IS_LINUX:
             self._unregister_hotkeys_evdev()
-        else:
-            self._unregister_hotkeys_keyboard()
+            return None
+        return self._submit_keyboard_task(self._unregister_hotkeys_keyboard)
+
+    def _submit_keyboard_task(self, task: Callable[[], None]) -> Future:
+        """Run a keyboard hook change on the hotkey worker thread.
+
+        Detaching low-level hooks can take tens of milliseconds on Windows, so
+        configure() doesn't wait for it. The single worker keeps
+        unregister/register calls in the order they were made.
+        """
+        if self._keyboard_executor is None:
+            self._keyboard_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hotkey")
+        return self._keyboard_executor.submit(task)
+
+    def _wait_keyboard_task(self, future: Optional[Future]) -> bool:
+        """Wait for a keyboard hook task, re-raising any exception it raised.
+
+        Returns False if the task is still running after the timeout.
+        """
+        if future is None:
+            return True
+        try:
+            future.result(timeout=_KEYBOARD_TASK_TIMEOUT)
+        except FutureTimeoutError:
+            log.warning("Timed out waiting for keyboard hotkey task", timeout=_KEYBOARD_TASK_TIMEOUT)
+            return False
+        return True
+
+    def _shutdown_keyboard_executor(self):
+        """Release the keyboard worker thread; a later start() creates a new one."""
+        if self._keyboard_executor is not None:
+            self._keyboard_executor.shutdown(wait=False)
+            self._keyboard_executor = None
+
+    @staticmethod
+    def _log_keyboard_task_error(future: Future):
+        """Log an exception raised by a keyboard hook task."""
+        error = future.exception()
+        if error is not None:
+            log.error("Keyboard hotkey task failed", error=str(error))
 
     # --- Windows: keyboard library ---
 
@@ -353,6 +550,9 @@ class HotkeyService:
         """Unregister all hotkeys (Windows)."""
         try:
             import keyboard
+            hook, self._hook = self._hook, None
+            if hook is not None:
+                keyboard.unhook(hook)
             keyboard.unhook_all()
         except Exception as e:
             log.error("Failed to unregister hotkeys", error=str(e))
@@ -364,40 +564,76 @@ class HotkeyService:
         try:
             keyboard.add_hotkey(self._hold_hotkey, self._on_hold_press, suppress=False)
 
-            # Monitor key releases to detect when user lets go
-            keys = self._parse_hotkey_keys(self._hold_hotkey)
-            for key in keys:
-                try:
-                    keyboard.on_release_key(key, self._check_hold_release_keyboard)
-                    if key == 'win':
-                        keyboard.on_release_key('windows', self._check_hold_release_keyboard)
-                        keyboard.on_release_key('left windows', self._check_hold_release_keyboard)
-                        keyboard.on_release_key('right windows', self._check_hold_release_keyboard)
-                except Exception as e:
-                    log.warning("Failed to register release handler for key", key=key, error=str(e))
+            # Track key presses and releases to detect when user lets go.
+            # One hook for all keys, filtered against the hold keys ourselves.
+            # Key state is reset here, on the worker after unhook_all(), so no
+            # event from the old hook can leave a stale pressed key behind.
+            self._pressed_scan_codes = set()
+            self._pressed_bit_counts = {}
+            self._pressed_mask = 0
+            try:
+                self._build_hold_scan_bits(keyboard.key_to_scan_codes)
+                self._hook = keyboard.hook(self._on_key_event_keyboard)
+            except Exception as e:
+                log.warning("Failed to register key release hook", error=str(e))
 
             log.info("Hold hotkey registered successfully", hotkey=self._hold_hotkey)
         except Exception as e:
             log.error("Failed to register hold hotkey", hotkey=self._hold_hotkey, error=str(e))
 
+    def _build_hold_scan_bits(self, key_to_scan_codes: Callable[[str], tuple[int, ...]]):
+        """Map every scan code of the hold hotkey keys to that key's bit (Windows).
+
+        key_to_scan_codes is keyboard.key_to_scan_codes, which covers both
+        sides of modifiers and ignores shift state, like on_release_key did.
+        """
+        scan_bits = {}
+        for key in self._hold_keys_parsed:
+            bit = self._hold_key_bits[key]
+            for name in (_WIN_SCAN_NAMES if key == 'win' else (key,)):
+                try:
+                    for code in key_to_scan_codes(name):
+                        scan_bits[code] = bit
+                except ValueError:
+                    continue  # Name unknown to this keyboard layout
+            if bit not in scan_bits.values():
+                log.warning("No scan codes found for hold key", key=key)
+        self._hold_scan_bits = scan_bits
+
+    def _on_key_event_keyboard(self, event):
+        """Dispatch a key event for one of the hold hotkey keys (Windows)."""
+        if event.scan_code not in self._hold_scan_bits:
+            return
+        if event.event_type == 'down':
+            self._mark_key_down_keyboard(event)
+        elif event.event_type == 'up':
+            self._check_hold_release_keyboard(event)
+
+    def _mark_key_down_keyboard(self, event):
+        """Record a hold hotkey key as pressed (Windows)."""
+        code = event.scan_code
+        if code in self._pressed_scan_codes:
+            return  # Key repeat
+        self._pressed_scan_codes.add(code)
+        bit = self._hold_scan_bits[code]
+        self._pressed_bit_counts[bit] = self._pressed_bit_counts.get(bit, 0) + 1
+        self._pressed_mask |= bit
+
     def _check_hold_release_keyboard(self, event):
         """Check if hold hotkey should be deactivated on key release (Windows)."""
-        import keyboard
+        code = event.scan_code
+        if code in self._pressed_scan_codes:
+            self._pressed_scan_codes.discard(code)
+            bit = self._hold_scan_bits[code]
+            count = self._pressed_bit_counts.get(bit, 1) - 1
+            self._pressed_bit_counts[bit] = count
+            if count <= 0:
+                self._pressed_mask &= ~bit
         if not self._hold_active:
             return
 
-        keys = self._parse_hotkey_keys(self._hold_hotkey)
-        all_pressed = True
-        for key in keys:
-            if key == 'win':
-                if not (keyboard.is_pressed('win') or keyboard.is_pressed('windows')):
-                    all_pressed = False
-                    break
-            elif not keyboard.is_pressed(key):
-                all_pressed = False
-                break
-
-        if not all_pressed:
+        required = self._hold_required_mask
+        if (self._pressed_mask & required) != required:
             log.debug("Hold key released", key=event.name)
             self._deactivate_hold()
 
@@ -471,8 +707,7 @@ class HotkeyService:
         elif event.value == 0:  # Key release
             # Check hold release before removing the key
             if self._hold_active:
-                hold_keys = set(self._parse_hotkey_keys(self._hold_hotkey))
-                if name in hold_keys:
+                if name in self._hold_keys_parsed:
                     log.debug("Hold key released (evdev)", key=name)
                     self._deactivate_hold()
             self._pressed_keys.discard(name)
@@ -482,14 +717,12 @@ class HotkeyService:
         """Check if the currently pressed keys match any registered hotkey combo."""
         # Check hold hotkey
         if self._hold_hotkey_enabled and self._hold_hotkey:
-            hold_keys = set(self._parse_hotkey_keys(self._hold_hotkey))
-            if hold_keys.issubset(self._pressed_keys):
+            if self._pressed_keys.issuperset(self._hold_keys_parsed):
                 self._on_hold_press()
 
         # Check toggle hotkey
         if self._toggle_hotkey_enabled and self._toggle_hotkey:
-            toggle_keys = set(self._parse_hotkey_keys(self._toggle_hotkey))
-            if toggle_keys.issubset(self._pressed_keys):
+            if self._pressed_keys.issuperset(self._toggle_keys_parsed):
                 if not self._hold_active:
                     self._on_toggle_press()
 
@@ -509,13 +742,21 @@ class HotkeyService:
             return
 
         self._running = True
-        self._register_hotkeys()
+        self._wait_keyboard_task(self._register_hotkeys())
 
     def stop(self):
-        """Stop listening for hotkeys."""
+        """Stop listening for hotkeys.
+
+        Waits for the hooks to be removed, so no hotkey callbacks fire after
+        this returns.
+        """
         self._running = False
-        self._unregister_hotkeys()
+        # Keep the worker if unhooking is still in progress, so a quick
+        # start() queues behind it instead of racing it on a new thread.
+        if self._wait_keyboard_task(self._unregister_hotkeys()):
+            self._shutdown_keyboard_executor()
         self._cancel_max_timer()
+        self._stop_max_timer_thread()
         self._hold_active = False
         self._toggle_active = False
 
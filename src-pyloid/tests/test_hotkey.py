@@ -1,5 +1,11 @@
 import pytest
-from services.hotkey import HotkeyService, normalize_hotkey, validate_hotkey, are_hotkeys_conflicting
+from services.hotkey import (
+    HotkeyService,
+    normalize_hotkey,
+    validate_hotkey,
+    are_hotkeys_conflicting,
+    find_conflicting_hotkeys,
+)
 
 
 class TestNormalizeHotkey:
@@ -59,6 +65,12 @@ class TestNormalizeHotkey:
         assert normalize_hotkey("CTRL+R") == "ctrl+r"
         assert normalize_hotkey("Ctrl+Win+X") == "ctrl+win+x"
 
+    def test_normalized_output_is_stable(self):
+        """Normalizing an already canonical hotkey returns it unchanged."""
+        normalized = normalize_hotkey("X+Shift+Control")
+        assert normalized == "ctrl+shift+x"
+        assert normalize_hotkey(normalized) == normalized
+
 
 class TestValidateHotkey:
     def test_valid_hotkey_with_modifier_and_key(self):
@@ -96,6 +108,13 @@ class TestValidateHotkey:
         assert is_valid is False
         assert "two keys" in error.lower()
 
+    def test_invalid_empty_key_part(self):
+        """Empty parts between '+' separators are rejected."""
+        for hotkey in ("ctrl+", "ctrl++r", "+r", "ctrl+ +r"):
+            is_valid, error = validate_hotkey(hotkey)
+            assert is_valid is False
+            assert "empty key" in error.lower()
+
 
 class TestAreHotkeysConflicting:
     def test_identical_hotkeys_conflict(self):
@@ -117,11 +136,32 @@ class TestAreHotkeysConflicting:
         assert are_hotkeys_conflicting("", "ctrl+r") is False
         assert are_hotkeys_conflicting("ctrl+r", "") is False
 
+    def test_blank_hotkeys_no_conflict(self):
+        """Whitespace-only hotkeys are treated as empty."""
+        assert are_hotkeys_conflicting(" ", "  ") is False
+        assert are_hotkeys_conflicting(" ", " ") is False
+
     def test_windows_variants_conflict(self):
         """'win' and 'windows' variants conflict."""
         assert are_hotkeys_conflicting("ctrl+win", "ctrl+windows") is True
 
 
+class TestFindConflictingHotkeys:
+    def test_finds_all_conflicting_pairs(self):
+        """Returns index pairs for every pair of equivalent hotkeys."""
+        hotkeys = ["ctrl+win", "ctrl+r", "windows+ctrl", "r+ctrl", "win+control"]
+        assert find_conflicting_hotkeys(hotkeys) == [(0, 2), (1, 3), (0, 4), (2, 4)]
+
+    def test_no_conflicts(self):
+        """Distinct hotkeys produce no pairs."""
+        assert find_conflicting_hotkeys(["ctrl+r", "ctrl+t", "ctrl+shift+win"]) == []
+
+    def test_empty_hotkeys_ignored(self):
+        """Empty hotkeys don't conflict with each other."""
+        assert find_conflicting_hotkeys(["", "", "ctrl+r"]) == []
+        assert find_conflicting_hotkeys([" ", "  "]) == []
+
+
 class TestHotkeyService:
     def test_initial_state_not_running(self):
         """Hotkey service starts in non-running state."""
@@ -193,3 +233,205 @@ class TestHotkeyService:
         time.sleep(0.1)
 
         service.stop()
+
+    def test_configure_updates_parsed_keys(self):
+        """Configuring a hotkey refreshes the precomputed key lists."""
+        service = HotkeyService()
+        assert service._hold_keys_parsed == ("ctrl", "win")
+
+        service.configure(hold_hotkey="r+alt", toggle_hotkey="windows+shift+ctrl")
+
+        assert service._hold_keys_parsed == ("alt", "r")
+        assert service._toggle_keys_parsed == ("ctrl", "shift", "win")
+
+    def test_expired_max_deadline_stops_recording(self):
+        """Recording stops once the max recording deadline has passed."""
+        import time
+
+        service = HotkeyService()
+        service._on_toggle_press()
+        service._start_max_timer()
+        assert service._check_max_deadline() is False
+
+        deactivated = []
+        service.set_callbacks(on_activate=lambda: None, on_deactivate=lambda: deactivated.append(True))
+        service._max_deadline = time.monotonic() - 1
+        assert service._check_max_deadline() is True
+        assert service.is_recording() is False
+
+        # A second check (e.g. from another thread) doesn't stop again
+        assert service._check_max_deadline() is False
+        assert deactivated == [True]
+
+        service.stop()
+
+    def test_restarted_heartbeat_does_not_share_stop_event(self):
+        """A heartbeat started after stop() doesn't un-stop the previous one."""
+        service = HotkeyService()
+        service._start_max_timer()
+        old_stop = service._max_timer_stop
+        service._stop_max_timer_thread()
+
+        service._start_max_timer()
+
+        assert old_stop.is_set()
+        assert service._max_timer_stop is not old_stop
+
+        service.stop()
+
+        service.stop()
+
+
+# Scan codes as reported by the keyboard library on Windows
+FAKE_SCAN_CODES = {
+    "ctrl": (29, 3613),  # left ctrl, right ctrl
+    "shift": (42, 54),
+    "win": (91, 92),
+    "a": (30,),
+    "1": (2,),
+}
+
+
+def fake_key_to_scan_codes(name):
+    """Stand-in for keyboard.key_to_scan_codes."""
+    if name not in FAKE_SCAN_CODES:
+        raise ValueError(f"Key {name!r} is not mapped to any known key.")
+    return FAKE_SCAN_CODES[name]
+
+
+def key_event(name, scan_code, event_type):
+    """Build a keyboard library style key event."""
+    from types import SimpleNamespace
+    return SimpleNamespace(name=name, scan_code=scan_code, event_type=event_type)
+
+
+class TestHoldReleaseKeyboard:
+    """Windows hold release detection from the single keyboard hook."""
+
+    def _start_hold(self, hold_hotkey, pressed):
+        service = HotkeyService()
+        deactivated = []
+        service.set_callbacks(on_activate=lambda: None, on_deactivate=lambda: deactivated.append(True))
+        service.configure(hold_hotkey=hold_hotkey)
+        service._build_hold_scan_bits(fake_key_to_scan_codes)
+        for name, scan_code in pressed:
+            service._on_key_event_keyboard(key_event(name, scan_code, "down"))
+        service._on_hold_press()
+        return service, deactivated
+
+    def test_release_deactivates_hold(self):
+        """Releasing a hold key ends hold mode; unrelated keys are ignored."""
+        service, deactivated = self._start_hold("ctrl+win", [("ctrl", 29), ("left windows", 91)])
+
+        service._on_key_event_keyboard(key_event("a", 30, "up"))
+        assert deactivated == []
+
+        service._on_key_event_keyboard(key_event("left windows", 91, "up"))
+        assert deactivated == [True]
+        assert service.is_recording() is False
+
+    def test_right_ctrl_release_deactivates_hold(self):
+        """Right-side modifiers are matched by scan code, not by event name."""
+        service, deactivated = self._start_hold("ctrl+win", [("right ctrl", 3613), ("left windows", 91)])
+
+        service._on_key_event_keyboard(key_event("right ctrl", 3613, "up"))
+
+        assert deactivated == [True]
+        assert service.is_recording() is False
+
+    def test_shifted_main_key_release_deactivates_hold(self):
+        """A main key reported under its shifted name ('!') still ends hold mode."""
+        service, deactivated = self._start_hold(
+            "ctrl+shift+1", [("ctrl", 29), ("shift", 42), ("!", 2)]
+        )
+
+        service._on_key_event_keyboard(key_event("!", 2, "up"))
+
+        assert deactivated == [True]
+        assert service.is_recording() is False
+
+    def test_releasing_one_of_both_held_win_keys_keeps_hold(self):
+        """With both Win keys held, hold mode ends only when the last one is released."""
+        service, deactivated = self._start_hold(
+            "ctrl+win", [("ctrl", 29), ("left windows", 91), ("right windows", 92)]
+        )
+
+        service._on_key_event_keyboard(key_event("left windows", 91, "up"))
+        assert deactivated == []
+        assert service.is_recording() is True
+
+        service._on_key_event_keyboard(key_event("right windows", 92, "up"))
+        assert deactivated == [True]
+
+    def test_key_repeat_does_not_keep_hold(self):
+        """Repeated down events for one key need only a single release."""
+        service, deactivated = self._start_hold("ctrl+win", [("ctrl", 29), ("left windows", 91)])
+        service._on_key_event_keyboard(key_event("ctrl", 29, "down"))
+        service._on_key_event_keyboard(key_event("ctrl", 29, "down"))
+
+        service._on_key_event_keyboard(key_event("ctrl", 29, "up"))
+
+        assert deactivated == [True]
+
+
+class TestKeyboardWorker:
+    """Windows keyboard hook changes run in order on a worker thread."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        import time
+        import services.hotkey as hotkey_module
+
+        calls = []
+
+        def fake_register(self):
+            calls.append("register")
+
+        def fake_unregister(self):
+            time.sleep(0.05)  # Simulate a slow low-level hook detach
+            calls.append("unregister")
+
+        monkeypatch.setattr(hotkey_module, "IS_LINUX", False)
+        monkeypatch.setattr(HotkeyService, "_register_hotkeys_keyboard", fake_register)
+        monkeypatch.setattr(HotkeyService, "_unregister_hotkeys_keyboard", fake_unregister)
+        return calls
+
+    def test_reconfigure_keeps_order_and_stop_waits(self, calls):
+        """Re-registration stays ordered and stop() returns only once hooks are removed."""
+        service = HotkeyService()
+        service.start()
+        service.configure(hold_hotkey="ctrl+r")
+        service.stop()
+
+        assert calls == ["register", "unregister", "register", "unregister"]
+        assert service._keyboard_executor is None
+
+    def test_restart_after_stop_timeout_stays_ordered(self, monkeypatch, calls):
+        """If stop() times out, a quick start() still registers after the unhook."""
+        import services.hotkey as hotkey_module
+
+        service = HotkeyService()
+        service.start()
+        monkeypatch.setattr(hotkey_module, "_KEYBOARD_TASK_TIMEOUT", 0.001)
+        service.stop()
+        assert service._keyboard_executor is not None  # Unhook still running
+
+        monkeypatch.setattr(hotkey_module, "_KEYBOARD_TASK_TIMEOUT", 2.0)
+        service.start()
+        service.stop()
+
+        assert calls == ["register", "unregister", "register", "unregister"]
+        assert service._keyboard_executor is None
+
+    def test_start_raises_registration_errors(self, monkeypatch, calls):
+        """Errors registering hotkeys reach the caller of start()."""
+        def failing_register(self):
+            raise ImportError("keyboard")
+
+        monkeypatch.setattr(HotkeyService, "_register_hotkeys_keyboard", failing_register)
+        service = HotkeyService()
+
+        with pytest.raises(ImportError):
+            service.start()
+
+        service.stop()